@@ -27,13 +27,19 @@ of a few cents.
 """
 
 # Standard library and third-party imports
+import os
+
+# TensorFlow reads these flags on import: use the oneDNN CPU kernels
+# and only log errors
+os.environ.setdefault("TF_ENABLE_ONEDNN_OPTS", "1")
+os.environ.setdefault("TF_CPP_MIN_LOG_LEVEL", "2")
+
 import numpy as np
-import pandas as pd
 import tensorflow as tf
 
 # Local imports
 from src.asset_classes import Stock, CallOption, PutOption
-from src.math_models import stock_path, option_path
+from src.math_models import stock_path, option_grid
 from src.decorators import timer
 
 
@@ -47,8 +53,7 @@ from src.decorators import timer
 # ================================================================
 
 # Mathematical simulation of a Geometric Brownian Motion
-df_stock = stock_path(random_state=55)
-t, X = df_stock["time"], df_stock["price"]
+t, X = stock_path(random_state=55)
 
 # Store data in Stock instance
 example_stock = Stock(t, X)
@@ -79,20 +84,19 @@ param_space = [(K, T, sigma, option_type)
                   for sigma in sigma_values
                   for option_type in option_types]
 
+# Price all parameter combinations in one broadcast evaluation
+K_arr, T_arr, sigma_arr, type_arr = map(np.array, zip(*param_space))
+price_matrix = option_grid(example_stock.price_grid,
+                           K_arr, T_arr, sigma_arr,
+                           is_call=(type_arr == "call"))
+
 option_dict = {}
 option_count = 0
 
 # Creating options from all parameter combinations
-for K, T, sigma, option_type in param_space:
+for (K, T, sigma, option_type), X in zip(param_space, price_matrix):
     option_count += 1
-
-    # Create the time and price column for the option
-    df_option = option_path(example_stock.time_grid,
-                            example_stock.price_grid,
-                            K, T, sigma,
-                            option_type=option_type)
-
-    t, X = df_option["time"], df_option["price"]
+    t = example_stock.time_grid
 
     if option_type == "call":
         # Save the result in a CallOption instance
@@ -122,35 +126,73 @@ for K, T, sigma, option_type in param_space:
 # Create, train and evaluate a Neural Network on the data.
 # ================================================================
 
-# Build an adequate DataFrame for this purpose.
-df_model = pd.DataFrame({"time": example_stock.time_grid})
-for i in range(1, option_count + 1):
-    option_prices = option_dict[i].price_grid
-    df_model[f"option_{i:03}"] = option_prices
-df_model["stock"] = example_stock.price_grid
+# Build the feature matrix (one column per option) and the target
+# directly as float32 arrays, the dtype the Neural Network trains in.
+option_matrix = np.column_stack([option_dict[i].price_grid
+                                 for i in range(1, option_count + 1)])
+feat = option_matrix.astype(np.float32, copy=False)
+target = example_stock.price_grid.astype(np.float32, copy=False)
 
 # Building the model
-deep_model = tf.keras.Sequential([
-    tf.keras.layers.Dense(32, activation='relu', input_shape=(option_count,)),
-    tf.keras.layers.Dense(32, activation='relu'),
-    tf.keras.layers.Dense(32, activation='relu'),
-    tf.keras.layers.Dense(32, activation='relu'),
-    tf.keras.layers.Dense(32, activation='relu'),
-    tf.keras.layers.Dense(1)
-])
+# Two hidden layers of 64 units each
+# The explicit float32 input builds the model right away, so the
+# training function is traced only once.
+inputs = tf.keras.Input(shape=(option_count,), dtype=tf.float32)
+x = inputs
+for _ in range(2):
+    x = tf.keras.layers.Dense(64, activation='relu')(x)
+outputs = tf.keras.layers.Dense(1)(x)
+deep_model = tf.keras.Model(inputs, outputs)
 
 # Splitting into training and test set
-X_train, y_train = df_model.iloc[:800, 1:option_count+1], df_model.iloc[:800, -1]
-X_test, y_test = df_model.iloc[800:, 1:option_count+1], df_model.iloc[800:, -1]
+X_train, y_train = feat[:800], target[:800]
+X_test, y_test = feat[800:], target[800:]
+
+# Hold out the last 20 % of the training data for validation and
+# convert both parts to tensors once, instead of on every epoch
+n_val = len(X_train) // 5
+
+# The training rows fit in memory, so shuffle them once up front
+# rather than through a shuffle buffer on every epoch
+perm = np.random.default_rng(0).permutation(len(X_train) - n_val)
+X_fit, y_fit = X_train[:-n_val][perm], y_train[:-n_val][perm]
+
+train_ds = (tf.data.Dataset.from_tensor_slices((X_fit, y_fit))
+            .cache()
+            .batch(32)
+            .prefetch(tf.data.AUTOTUNE))
+val_ds = (tf.data.Dataset.from_tensor_slices((X_train[-n_val:], y_train[-n_val:]))
+          .cache()
+          .batch(32)
+          .prefetch(tf.data.AUTOTUNE))
+
+# Count the batches per epoch before the datasets are repeated, as
+# repeated or device-prefetched datasets no longer report their size
+train_steps = int(train_ds.cardinality())
+val_steps = int(val_ds.cardinality())
+train_ds = train_ds.repeat()
+val_ds = val_ds.repeat()
 
 # Fitting the model to the first 80 % of intraday price data
 # Note: Model knows nothing of the option parameters but the price!
-deep_model.compile(optimizer='adam', loss='mse')
+# Running a whole epoch per call and compiling with XLA keeps the
+# Python overhead per training step low for this small model.
+deep_model.compile(optimizer='adam', loss='mse',
+                   steps_per_execution=train_steps, jit_compile=True)
+
+# The whole dataset fits in device memory, so copy batches to the GPU
+# ahead of time instead of synchronously at each training step
+if tf.config.list_physical_devices("GPU"):
+    train_ds = train_ds.apply(
+        tf.data.experimental.prefetch_to_device("/GPU:0", buffer_size=2))
+    val_ds = val_ds.apply(
+        tf.data.experimental.prefetch_to_device("/GPU:0", buffer_size=2))
 
 # Wrap this in a function to measure the time
 @timer
 def model_fit():
-    return deep_model.fit(X_train, y_train, epochs=50, batch_size=32, validation_split=0.2)
+    return deep_model.fit(train_ds, epochs=50, steps_per_epoch=train_steps,
+                          validation_data=val_ds, validation_steps=val_steps)
 model_fit()
 
 # Measuring the error on the remaining 20 % of the day
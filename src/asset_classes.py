@@ -23,9 +23,20 @@ PutOption
     A European put option, subclass of Asset.
 """
 
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
+from matplotlib.figure import Figure
+
+from src.math_models import DTYPE
+
+# pyarrow provides a faster CSV writer, pandas is used without it
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
 
 
 # Specifying line colors for asset types
@@ -34,6 +45,13 @@ ASSET_COLOR = {"Asset": "black",
               "CallOption": "darkblue",
               "PutOption": "deepskyblue"}
 
+# The plot theme only needs to be set once
+sns.set_theme(style="darkgrid")
+
+# Figure reused by all saved asset plots, created on first use. It is
+# not managed by pyplot, so it is never shown and never needs closing.
+_FIG = None
+
 
 def plot_asset(asset,
                plot_title: str = None,
@@ -48,26 +66,32 @@ def plot_asset(asset,
         Specifies whether to show or save the plot.
     """
 
-    sns.set_theme(style="darkgrid")
-
-    # Color of price line
+    global _FIG
 
-    # Create a plot
-    plt.figure(figsize=(12, 8))
+    # Create a plot. Saved plots reuse the figure of the previous call.
+    if plot_save_in_file:
+        if _FIG is None:
+            _FIG = Figure(figsize=(12, 8))
+        else:
+            _FIG.clear()
+        fig = _FIG
+    else:
+        fig = plt.figure(figsize=(12, 8))
+    ax = fig.gca()
 
+    # Color of price line
     plot_color = ASSET_COLOR[asset.__class__.__name__]
-    plt.plot(asset.time_grid, asset.price_grid,
-             color=plot_color, lw=2)
+    ax.plot(asset.time_grid, asset.price_grid,
+            color=plot_color, lw=2)
 
     # Change appearance
-    plt.grid(visible=True, linestyle="--", alpha=0.7)
-    ax = plt.gca()
+    ax.grid(visible=True, linestyle="--", alpha=0.7)
     ax.spines["left"].set_color("black")
     ax.spines["bottom"].set_color("black")
 
     # Labels and title
-    plt.xlabel("\nTime", fontsize=14)
-    plt.ylabel("Price\n", fontsize=14)
+    ax.set_xlabel("\nTime", fontsize=14)
+    ax.set_ylabel("Price\n", fontsize=14)
 
     # Default title
     if not plot_title:
@@ -75,9 +99,8 @@ def plot_asset(asset,
 
     # Store in file when specified in function call
     if plot_save_in_file:
-        plt.title(label=f"{plot_title}\n", fontsize=16)
-        plt.savefig(f"./data/{plot_title.replace(' ', '_')}_plot.png", dpi=300)
-        plt.close()
+        ax.set_title(label=f"{plot_title}\n", fontsize=16)
+        fig.savefig(f"./data/{plot_title.replace(' ', '_')}_plot.png", dpi=300)
     else:
         plt.show()
 
@@ -96,10 +119,24 @@ def export_asset(asset,
     if file_name is None:
         file_name = asset.__class__.__name__
 
+    path = f"./data/{file_name.replace(' ', '_')}_data.csv"
+
+    if pa is not None:
+        # pyarrow quotes column names, so the header is written as
+        # plain text to match the pandas output
+        with open(path, "wb") as csv_file:
+            csv_file.write(b"time,price\n")
+            pa_csv.write_csv(pa.table({'time': asset.time_grid,
+                                       'price': asset.price_grid}),
+                             csv_file,
+                             pa_csv.WriteOptions(include_header=False,
+                                                 quoting_style="none"))
+        return
+
     pd.DataFrame({'time': asset.time_grid,
                   'price': asset.price_grid
                  }
-                ).to_csv(path_or_buf = f"./data/{file_name.replace(' ', '_')}_data.csv",
+                ).to_csv(path_or_buf = path,
                          index=False)
 
 
@@ -118,9 +155,9 @@ class Asset:
     ----------
     asset_type : str
         The type of the asset.
-    time_grid : pd.Series
+    time_grid : np.ndarray
         List of times at which a price has been observed.
-    price_grid : pd.Series
+    price_grid : np.ndarray
         List of observed prices at each point in time.
 
     Methods
@@ -136,12 +173,12 @@ class Asset:
     """
 
     def __init__(self,
-                 time_grid: pd.Series,
-                 price_grid: pd.Series) -> None:
+                 time_grid: np.ndarray,
+                 price_grid: np.ndarray) -> None:
 
         self.asset_type = "Asset"
-        self.time_grid = time_grid
-        self.price_grid = price_grid
+        self.time_grid = np.ascontiguousarray(time_grid, dtype=DTYPE)
+        self.price_grid = np.ascontiguousarray(price_grid, dtype=DTYPE)
 
     def __str__(self) -> str:
         """Provides a human-readable description of the asset."""
@@ -173,9 +210,9 @@ class Stock(Asset):
     ----------
     asset_type : str
         The type of the asset.
-    time_grid : pd.Series
+    time_grid : np.ndarray
         List of times at which a price has been observed.
-    price_grid : pd.Series
+    price_grid : np.ndarray
         List of observed prices at each point in time.
 
     Methods
@@ -191,8 +228,8 @@ class Stock(Asset):
     """
 
     def __init__(self,
-                 time_grid: pd.Series,
-                 price_grid: pd.Series) -> None:
+                 time_grid: np.ndarray,
+                 price_grid: np.ndarray) -> None:
 
         super().__init__(time_grid, price_grid)
         self.asset_type = "Stock"
@@ -212,9 +249,9 @@ class CallOption(Asset):
     ----------
         asset_type : str
             The type of the asset.
-        time_grid : pd.Series
+        time_grid : np.ndarray
             List of times at which a price has been observed.
-        price_grid : pd.Series
+        price_grid : np.ndarray
             List of observed prices at each point in time.
         strike : float
             The strike price of the call option, i.e. the price
@@ -238,8 +275,8 @@ class CallOption(Asset):
     """
 
     def __init__(self,
-                 time_grid: pd.Series,
-                 price_grid: pd.Series,
+                 time_grid: np.ndarray,
+                 price_grid: np.ndarray,
                  maturity: float,
                  strike: float,
                  volatility: float) -> None:
@@ -265,9 +302,9 @@ class PutOption(Asset):
         ----------
             asset_type : str
                 The type of the asset.
-            time_grid : pd.Series
+            time_grid : np.ndarray
                 List of times at which a price has been observed.
-            price_grid : pd.Series
+            price_grid : np.ndarray
                 List of observed prices at each point in time.
             strike : float
                 The strike price of the call option, i.e. the price
@@ -291,8 +328,8 @@ class PutOption(Asset):
         """
 
     def __init__(self,
-                 time_grid: pd.Series,
-                 price_grid: pd.Series,
+                 time_grid: np.ndarray,
+                 price_grid: np.ndarray,
                  maturity: float,
                  strike: float,
                  volatility: float) -> None:
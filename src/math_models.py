@@ -8,23 +8,31 @@ Geometric Brownian motion for simulating stock paths.
 
 Functions
 ---------
+bs_pricer_factory(K, T, sigma, option_type, r)
+    Create a Black-Scholes pricer for fixed option parameters.
 black_scholes_price(S0, X, T, sigma, r)
     Compute the current theoretical price of an option.
 stock_path(T, n_steps, x0, mu, sigma, random_state)
     Simulates an intraday course of a stock.
 option_path(t_grid, S_grid, K, T, r, sigma, option_type, random_state)
     Simulates the intraday course of an option.
+option_grid(S_grid, K, T, sigma, is_call, r)
+    Simulates the intraday course of many options at once.
 
 Attributes
 ----------
 RISK_FREE
     The assumed default risk-free interest rate.
+DTYPE
+    The floating-point type of all simulated price paths.
 """
 
+import math
+from typing import Callable
+
 import numpy as np
-import pandas as pd
 from numpy import ndarray, dtype, floating
-from scipy.stats import norm
+from scipy.special import ndtr
 
 
 # The risk-free interest rate used by default throughout the models.
@@ -34,13 +42,74 @@ from scipy.stats import norm
 # Currently, 2.0 % as per the German 7-year bond (DE000BU22114).
 RISK_FREE = 0.02
 
+# Prices are only needed to a few significant digits, so all paths
+# are simulated in single precision.
+DTYPE = np.float32
+
+
+def bs_pricer_factory(K: float,
+                      T: float,
+                      sigma: float,
+                      option_type: str,
+                      r: float = RISK_FREE) -> Callable | None:
+    """
+    Create a Black-Scholes pricer for an option with fixed parameters.
+
+    All terms of the Black-Scholes formula that do not depend on the
+    price of the underlying stock are computed once here. The returned
+    function only evaluates the terms that depend on S0, which makes
+    repeated pricing of the same option cheaper.
+
+    Parameters
+    ----------
+    K : float
+        The strike price of the option.
+    T : float
+        The remaining time until maturity in years.
+    sigma : float
+        The volatility of the option.
+    option_type : str
+        "call" or "put", type of the option.
+    r : float
+        The current annual risk-free interest rate.
+
+    Returns
+    -------
+    Callable
+        A function mapping S0 (float or ndarray) to the current
+        Black-Scholes price of the option.
+    """
+
+    # Terms independent of the price of the underlying stock. As plain
+    # Python floats they keep the precision of S0 in the closure.
+    sigma_sqrt_T = sigma * math.sqrt(T)
+    K_disc = K * math.exp(-r * T)
+    drift = r * T + 0.5 * sigma * sigma * T
+    log_K = math.log(K)
+
+    if option_type == "call":
+        def call_price(S0):
+            d1 = (np.log(S0) - log_K + drift) / sigma_sqrt_T
+            d2 = d1 - sigma_sqrt_T
+            return S0 * ndtr(d1) - K_disc * ndtr(d2)
+        return call_price
+
+    if option_type == "put":
+        def put_price(S0):
+            d1 = (np.log(S0) - log_K + drift) / sigma_sqrt_T
+            d2 = d1 - sigma_sqrt_T
+            return K_disc * ndtr(-d2) - S0 * ndtr(-d1)
+        return put_price
+
+    return None
+
 
-def black_scholes_price(S0: float,
+def black_scholes_price(S0: float | ndarray,
                         K: float,
                         T: float,
                         sigma: float,
                         option_type: str,
-                        r: float = RISK_FREE) -> float | None:
+                        r: float = RISK_FREE) -> float | ndarray | None:
     """
     Compute the theoretical price for a given call option.
 
@@ -52,8 +121,9 @@ def black_scholes_price(S0: float,
 
     Parameters
     ----------
-    S0 : float
-        The market price of the underlying stock.
+    S0 : float or ndarray
+        The market price of the underlying stock. An array of
+        prices is evaluated element-wise in a single pass.
     K : float
         The strike price of the option.
     T : float
@@ -67,21 +137,17 @@ def black_scholes_price(S0: float,
 
     Returns
     -------
-    float
-        The current Black-Scholes price of the option.
+    float or ndarray
+        The current Black-Scholes price of the option, with the
+        same shape as S0.
     """
 
-    if option_type == "call":
-        d1 = (np.log(S0 / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * np.sqrt(T))
-        d2 = d1 - sigma * np.sqrt(T)
-        return S0 * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
+    pricer = bs_pricer_factory(K, T, sigma, option_type, r)
 
-    if option_type == "put":
-        d1 = (np.log(S0 / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * np.sqrt(T))
-        d2 = d1 - sigma * np.sqrt(T)
-        return K * np.exp(-r * T) * norm.cdf(-d2) - S0 * norm.cdf(-d1)
+    if pricer is None:
+        return None
 
-    return None
+    return pricer(S0)
 
 
 def stock_path(T: float = 1.0,
@@ -89,7 +155,7 @@ def stock_path(T: float = 1.0,
                x0: float = 10.0,
                mu: float = 0.01,
                sigma: float = 0.5,
-               random_state: int | None = None) -> pd.DataFrame:
+               random_state: int | None = None) -> tuple[ndarray, ndarray]:
     """
     Simulate one realization of the following SDE on [0, T]:
     dXt = mu Xt dt + sigma Xt dWt.
@@ -127,30 +193,29 @@ def stock_path(T: float = 1.0,
 
     # Discretize the time frame
     dt = T / n_steps
-    t_grid = np.linspace(0.0, T, n_steps + 1)
+    t_grid = np.linspace(0.0, T, n_steps + 1, dtype=DTYPE)
 
     # Simulate a Brownian motion with N(0, sqrt(dt)) increments
-    dW = rng.normal(loc=0.0, scale=np.sqrt(dt), size=n_steps)
+    dW = rng.normal(loc=0.0, scale=np.sqrt(dt), size=n_steps).astype(DTYPE)
 
-    # X_grid[i] represents the price of the stock at time i
-    X_grid = np.zeros(n_steps + 1)
-    X_grid[0] = x0
+    # The GBM update is multiplicative, so the path is the initial
+    # price times the exponential of the cumulated log-increments
+    increments = (mu - 0.5 * sigma**2) * dt + sigma * dW
+    log_path = np.concatenate((np.zeros(1, dtype=DTYPE), np.cumsum(increments)))
 
-    for i in range(n_steps):
-        X_grid[i + 1] = X_grid[i] * np.exp(
-            (mu - 0.5 * sigma**2) * dt + sigma * dW[i]
-        )
+    # X_grid[i] represents the price of the stock at time i
+    X_grid = x0 * np.exp(log_path)
 
-    return pd.DataFrame({"time": t_grid, "price": X_grid})
+    return t_grid, X_grid
 
 
-def option_path(t_grid: pd.Series,
-                S_grid: pd.Series,
+def option_path(t_grid: ndarray,
+                S_grid: ndarray,
                 K: float,
                 T: float,
                 sigma: float,
                 option_type: str,
-                r: float = RISK_FREE) -> pd.DataFrame:
+                r: float = RISK_FREE) -> tuple[ndarray, ndarray]:
     """
     Simulate one intraday price data of an option.
 
@@ -161,10 +226,10 @@ def option_path(t_grid: pd.Series,
 
     Parameters
     ----------
-    t_grid : pd.Series of dtype float64
+    t_grid : ndarray of dtype float32
         Time grid of the underlying asset.
         Must be of same length as S_grid.
-    S_grid : pd.Series of dtype float64
+    S_grid : ndarray of dtype float32
         Price of the underlying asset at times t_grid.
         Must be of same length as t_grid.
     K : float
@@ -180,20 +245,67 @@ def option_path(t_grid: pd.Series,
 
     Returns
     -------
-    DataFrame ["time", "price"]
+    t_grid : ndarray
+        Time grid of the option.
+    X_grid : ndarray
+        Price of the option at times t_grid.
     """
 
-    n = len(t_grid)
-    X_grid = np.zeros(n)
+    # Price every tick at once instead of looping over S_grid
+    X_grid = black_scholes_price(S_grid, K, T, sigma, option_type, r)
 
-    if option_type == "call":
-        for i in range(n):
-            X_grid[i] = black_scholes_price(
-                S_grid[i], K, T, sigma, "call", r)
-    elif option_type == "put":
-        for i in range(n):
-            X_grid[i] = black_scholes_price(
-                S_grid[i], K, T, sigma, "put", r)
+    return t_grid, X_grid
+
+
+def option_grid(S_grid: ndarray,
+                K: ndarray,
+                T: ndarray,
+                sigma: ndarray,
+                is_call: ndarray,
+                r: float = RISK_FREE) -> ndarray:
+    """
+    Simulate the intraday price data of several options at once.
+
+    All options share the same underlying asset. Their parameters are
+    broadcast against the price path of the underlying asset, so the
+    Black-Scholes prices of every option at every tick are computed
+    in one vectorized evaluation instead of one call per option.
+
+
+    Parameters
+    ----------
+    S_grid : ndarray of shape (n_ticks,)
+        Price of the underlying asset over time.
+    K : ndarray of shape (n_options,)
+        The strike prices of the options.
+    T : ndarray of shape (n_options,)
+        Time in years until maturity of the options.
+    sigma : ndarray of shape (n_options,)
+        Volatility coefficients of the underlying asset.
+    is_call : ndarray of shape (n_options,) and dtype bool
+        True for call options, False for put options.
+    r : float
+        Assumed risk-free interest rate.
+
+    Returns
+    -------
+    ndarray of shape (n_options, n_ticks)
+        Row i holds the price path of option i.
+    """
+
+    # Parameters as columns, prices of the underlying as a row
+    K = np.asarray(K, dtype=DTYPE)[:, None]
+    T = np.asarray(T, dtype=DTYPE)[:, None]
+    sigma = np.asarray(sigma, dtype=DTYPE)[:, None]
+    is_call = np.asarray(is_call, dtype=bool)[:, None]
+    S = np.asarray(S_grid, dtype=DTYPE)[None, :]
+
+    sqrt_T = np.sqrt(T)
+    disc = np.exp(-r * T)
+    d1 = (np.log(S / K) + (r + 0.5 * sigma * sigma) * T) / (sigma * sqrt_T)
+    d2 = d1 - sigma * sqrt_T
 
-    return pd.DataFrame({"time": t_grid, "price": X_grid})
+    call = S * ndtr(d1) - K * disc * ndtr(d2)
+    put = K * disc * ndtr(-d2) - S * ndtr(-d1)
 
+    return np.where(is_call, call, put)